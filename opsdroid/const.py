@@ -33,6 +33,17 @@ EXAMPLE_CONFIG_FILE = os.path.join(
 )
 REGEX_PARSE_SCORE_FACTOR = 0.6
 
+DEFAULT_PARSER_COSTS = {
+    "regex": 0,
+    "parse_format": 0,
+    "rasanlu": 5,
+    "dialogflow": 10,
+    "luisai": 10,
+    "sapcai": 10,
+    "witai": 10,
+    "watson": 10,
+}
+
 RASANLU_DEFAULT_URL = "http://localhost:5000"
 RASANLU_DEFAULT_MODELS_PATH = "models"
 RASANLU_DEFAULT_TRAIN_MODEL = True
@@ -5,6 +5,7 @@ import anyio
 import contextlib
 import copy
 import inspect
+import itertools
 import logging
 import os
 import signal
@@ -17,7 +18,7 @@ from watchgod import PythonWatcher, awatch
 from opsdroid import events
 from opsdroid.configuration import load_config_file
 from opsdroid.connector import Connector
-from opsdroid.const import DEFAULT_CONFIG_LOCATIONS
+from opsdroid.const import DEFAULT_CONFIG_LOCATIONS, DEFAULT_PARSER_COSTS
 from opsdroid.database import Database, InMemoryDatabase
 from opsdroid.helper import get_parser_config
 from opsdroid.loader import Loader
@@ -27,6 +28,7 @@ from opsdroid.parsers.catchall import parse_catchall
 from opsdroid.parsers.crontab import parse_crontab
 from opsdroid.parsers.dialogflow import parse_dialogflow
 from opsdroid.parsers.event_type import parse_event_type
+from opsdroid.parsers.index import MatcherIndex
 from opsdroid.parsers.luisai import parse_luisai
 from opsdroid.parsers.parseformat import parse_format
 from opsdroid.parsers.rasanlu import (
@@ -34,7 +36,7 @@ from opsdroid.parsers.rasanlu import (
     train_rasanlu,
     rasa_usable,
 )
-from opsdroid.parsers.regex import parse_regex
+from opsdroid.parsers.regex import RegexMatcherSet, parse_regex
 from opsdroid.parsers.sapcai import parse_sapcai
 from opsdroid.parsers.watson import parse_watson
 from opsdroid.parsers.witai import parse_witai
@@ -73,6 +75,7 @@ class OpsDroid:
                 )
                 self.eventloop.set_exception_handler(self.handle_async_exception)
         self.skills = []
+        self.matcher_index = MatcherIndex()
         self.memory = Memory()
         self.modules = {}
         self.loader = Loader(self)
@@ -86,6 +89,8 @@ class OpsDroid:
             "webhooks_called": 0,
             "total_response_time": 0,
             "total_responses": 0,
+            "parser_timeouts": 0,
+            "parsers": {},
         }
         self.web_server = None
         self.stored_path = []
@@ -235,6 +240,8 @@ class OpsDroid:
         _LOGGER.debug(_("Loaded %i skills."), len(self.modules["skills"] or []))
         self.web_server = Web(self)
         self.setup_skills(self.modules["skills"])
+        self.matcher_index.build(self.skills)
+        self.get_compiled_matchers("regex", RegexMatcherSet)
         await self.setup_databases(self.modules["databases"] or {})
         await self.setup_connectors(self.modules["connectors"] or {})
         self.web_server.setup_webhooks(self.skills)
@@ -329,6 +336,41 @@ class OpsDroid:
             skill.config = config
         self.skills.append(skill)
 
+    def get_matchers(self, kind, skills=None):
+        """Get the registered matchers of a given kind.
+
+        The matcher index is built when opsdroid is loaded. If the list of
+        skills has changed since then (e.g. skills appended after loading) the
+        index is rebuilt before returning.
+
+        Args:
+            kind (string): The kind of matcher, e.g. ``regex`` or ``always``.
+            skills (list, optional): Restrict the result to these skills.
+
+        Returns:
+            list: A list of ``(skill, matcher)`` tuples.
+
+        """
+        if self.matcher_index.is_stale(self.skills):
+            self.matcher_index.build(self.skills)
+        return self.matcher_index.get(kind, skills)
+
+    def get_compiled_matchers(self, kind, compiler):
+        """Get the registered matchers of a given kind in compiled form.
+
+        Args:
+            kind (string): The kind of matcher, e.g. ``regex``.
+            compiler (callable): Called with the ``(skill, matcher)`` tuples
+                of that kind to build the compiled form.
+
+        Returns:
+            The compiled matchers, cached until the matcher index is rebuilt.
+
+        """
+        if self.matcher_index.is_stale(self.skills):
+            self.matcher_index.build(self.skills)
+        return self.matcher_index.get_compiled(kind, compiler)
+
     async def watch_paths(self):
         """Watch locally installed skill paths for file changes and reload on change.
 
@@ -492,9 +534,72 @@ class OpsDroid:
                 )
                 await event.respond(events.Message(_("Check the log for details.")))
 
+    def get_parser_stages(self, skills, message):
+        """Get the parser stages which apply to a message, cheapest first.
+
+        Each stage is a tuple of ``(cost, name, config, parse)`` where ``parse``
+        is a callable returning the parser coroutine. The local matchers run
+        first and the NLU parsers, which call out to remote services, are
+        ordered by their ``cost``. The default costs can be overridden with a
+        ``cost`` option in the config of each parser.
+
+        Args:
+            skills (list): List of all available skills.
+            message (opsdroid.events.Event): The event being parsed.
+
+        Returns:
+            list: The enabled parser stages sorted by cost.
+
+        """
+        parsers = self.modules.get("parsers") or []
+        stages = []
+
+        if isinstance(message, events.Message):
+            for name, parser in (
+                ("regex", parse_regex),
+                ("parse_format", parse_format),
+            ):
+                config = get_parser_config(name, parsers) or {}
+                stages.append(
+                    (
+                        config.get("cost", DEFAULT_PARSER_COSTS[name]),
+                        name,
+                        config,
+                        lambda config, parser=parser: parser(self, skills, message),
+                    )
+                )
+
+        for name, parser in (
+            ("dialogflow", parse_dialogflow),
+            ("luisai", parse_luisai),
+            ("sapcai", parse_sapcai),
+            ("witai", parse_witai),
+            ("watson", parse_watson),
+            ("rasanlu", parse_rasanlu),
+        ):
+            config = get_parser_config(name, parsers)
+            if config and config["enabled"]:
+                stages.append(
+                    (
+                        config.get("cost", DEFAULT_PARSER_COSTS[name]),
+                        name,
+                        config,
+                        lambda config, parser=parser: parser(
+                            self, skills, message, config
+                        ),
+                    )
+                )
+
+        return sorted(stages, key=lambda stage: stage[0])
+
     async def get_ranked_skills(self, skills, message):
         """Take a message and return a ranked list of matching skills.
 
+        The parser stages are run in order of cost, stages with the same cost
+        are run concurrently. If ``short-circuit-score`` is set in the
+        ``parser-pipeline`` section of the config, the remaining stages are
+        skipped as soon as a skill scoring at least that much has matched.
+
         Args:
             skills (list): List of all available skills.
             message (string): Context message to base the ranking of skills on.
@@ -504,47 +609,69 @@ class OpsDroid:
 
         """
         ranked_skills = []
-        if isinstance(message, events.Message):
-            ranked_skills += await parse_regex(self, skills, message)
-            ranked_skills += await parse_format(self, skills, message)
+        threshold = self.config.get("parser-pipeline", {}).get("short-circuit-score")
+        short_circuited = False
+
+        _LOGGER.debug(_("Processing parsers..."))
+        for _cost, stages in itertools.groupby(
+            self.get_parser_stages(skills, message), key=lambda stage: stage[0]
+        ):
+            stages = list(stages)
+            if short_circuited:
+                for _, name, _, _ in stages:
+                    self._count_parser_stage(name, "skips")
+                continue
+
+            pending = []
+            for _, name, config, parse in stages:
+                _LOGGER.debug(_("Checking %s..."), name)
+                pending.append(
+                    self._run_parser(name, parse(config), config.get("timeout"))
+                )
 
-        if "parsers" in self.modules:
-            _LOGGER.debug(_("Processing parsers..."))
-            parsers = self.modules.get("parsers", {})
+            for (_, name, _, _), parsed_skills in zip(
+                stages, await asyncio.gather(*pending)
+            ):
+                if parsed_skills:
+                    self._count_parser_stage(name, "hits")
+                ranked_skills += parsed_skills
 
-            dialogflow = get_parser_config("dialogflow", parsers)
-            if dialogflow and dialogflow["enabled"]:
-                _LOGGER.debug(_("Checking dialogflow..."))
-                ranked_skills += await parse_dialogflow(
-                    self, skills, message, dialogflow
-                )
+            if threshold is not None and any(
+                skill["score"] >= threshold for skill in ranked_skills
+            ):
+                short_circuited = True
 
-            luisai = get_parser_config("luisai", parsers)
-            if luisai and luisai["enabled"]:
-                _LOGGER.debug(_("Checking luisai..."))
-                ranked_skills += await parse_luisai(self, skills, message, luisai)
+        return sorted(ranked_skills, key=lambda k: k["score"], reverse=True)
 
-            sapcai = get_parser_config("sapcai", parsers)
-            if sapcai and sapcai["enabled"]:
-                _LOGGER.debug(_("Checking SAPCAI..."))
-                ranked_skills += await parse_sapcai(self, skills, message, sapcai)
+    def _count_parser_stage(self, name, counter):
+        """Increment a counter of a parser stage in the stats."""
+        stage_stats = self.stats["parsers"].setdefault(name, {"hits": 0, "skips": 0})
+        stage_stats[counter] = stage_stats[counter] + 1
 
-            witai = get_parser_config("witai", parsers)
-            if witai and witai["enabled"]:
-                _LOGGER.debug(_("Checking wit.ai..."))
-                ranked_skills += await parse_witai(self, skills, message, witai)
+    async def _run_parser(self, name, parser, timeout=None):
+        """Await a parser, giving up on it after a timeout.
 
-            watson = get_parser_config("watson", parsers)
-            if watson and watson["enabled"]:
-                _LOGGER.debug(_("Checking IBM Watson..."))
-                ranked_skills += await parse_watson(self, skills, message, watson)
+        Args:
+            name (string): Name of the parser.
+            parser (coroutine): The parser coroutine returning matched skills.
+            timeout (float, optional): Seconds to wait for the parser. Waits
+                forever if ``None``.
 
-            rasanlu = get_parser_config("rasanlu", parsers)
-            if rasanlu and rasanlu["enabled"]:
-                _LOGGER.debug(_("Checking Rasa NLU..."))
-                ranked_skills += await parse_rasanlu(self, skills, message, rasanlu)
+        Returns:
+            list: The skills matched by the parser or an empty list if it
+                timed out.
 
-        return sorted(ranked_skills, key=lambda k: k["score"], reverse=True)
+        """
+        try:
+            return await asyncio.wait_for(parser, timeout)
+        except asyncio.TimeoutError:
+            self.stats["parser_timeouts"] = self.stats["parser_timeouts"] + 1
+            _LOGGER.warning(
+                _("Parser %s timed out after %s seconds, ignoring its results."),
+                name,
+                timeout,
+            )
+            return []
 
     def get_connector(self, name):
         """Get a connector object.
@@ -0,0 +1,111 @@
+"""An index of skill matchers keyed by matcher kind."""
+
+import logging
+from collections import defaultdict
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def matcher_kind(matcher):
+    """Return the kind of a matcher.
+
+    Every matcher decorator in :mod:`opsdroid.matchers` stores its options
+    in a dictionary whose first key names the kind of matcher, for example
+    ``regex``, ``always`` or ``crontab``.
+
+    Args:
+        matcher (dict): A matcher added to a skill by a decorator.
+
+    Returns:
+        string: The kind of the matcher or ``None`` if it is empty.
+
+    """
+    return next(iter(matcher), None)
+
+
+class MatcherIndex:
+    """Lookup table of ``(skill, matcher)`` pairs grouped by matcher kind.
+
+    Parsers used to scan every matcher of every skill for each event. The
+    index is built once when the skills are set up so that each parser only
+    visits the skills which can actually match.
+
+    The index remembers the list of skills it was built from. Skills which
+    are added to that list after the index was built (or a list which has
+    been replaced entirely, for example on ``unload``) will cause the index
+    to be flagged as stale so that it can be rebuilt on next use.
+
+    """
+
+    def __init__(self):
+        """Create an empty index."""
+        self.entries = {}
+        self.compiled = {}
+        self._skills = None
+        self._size = 0
+
+    def build(self, skills):
+        """Build the index from a list of skills.
+
+        Args:
+            skills (list): A list of skill callables with a ``matchers`` attribute.
+
+        """
+        entries = defaultdict(list)
+        for skill in skills:
+            for matcher in getattr(skill, "matchers", []):
+                kind = matcher_kind(matcher)
+                if kind is not None:
+                    entries[kind].append((skill, matcher))
+
+        self.entries = dict(entries)
+        self.compiled = {}
+        self._skills = skills
+        self._size = len(skills)
+        _LOGGER.debug(
+            _("Indexed matchers for %i skills: %s."),
+            self._size,
+            {kind: len(pairs) for kind, pairs in self.entries.items()},
+        )
+
+    def is_stale(self, skills):
+        """Check whether the index no longer reflects a list of skills."""
+        return skills is not self._skills or len(skills) != self._size
+
+    def get(self, kind, skills=None):
+        """Get the matchers of a given kind.
+
+        Args:
+            kind (string): The kind of matcher, e.g. ``regex``.
+            skills (list, optional): Only return matchers belonging to these
+                skills. Defaults to all indexed skills.
+
+        Returns:
+            list: A list of ``(skill, matcher)`` tuples in skill order.
+
+        """
+        pairs = self.entries.get(kind, [])
+        if skills is None or skills is self._skills:
+            return pairs
+
+        allowed = {id(skill) for skill in skills}
+        return [(skill, matcher) for skill, matcher in pairs if id(skill) in allowed]
+
+    def get_compiled(self, kind, compiler):
+        """Get a compiled representation of the matchers of a given kind.
+
+        The compiler is called with the list of ``(skill, matcher)`` tuples of
+        that kind the first time this is called after the index was built and
+        its result is cached until the index is rebuilt.
+
+        Args:
+            kind (string): The kind of matcher, e.g. ``regex``.
+            compiler (callable): Builds the compiled form from the matchers.
+
+        Returns:
+            The object returned by the compiler.
+
+        """
+        if kind not in self.compiled:
+            self.compiled[kind] = compiler(self.entries.get(kind, []))
+        return self.compiled[kind]
@@ -1,8 +1,16 @@
 """A helper function for parsing and executing regex skills."""
 
 import logging
+import warnings
+from collections import deque
+
 import regex
 
+try:
+    from re import _parser as sre_parse
+except ImportError:  # pragma: no cover
+    import sre_parse
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -34,31 +42,203 @@ async def match_regex(text, opts):
     return matched_regex
 
 
+def required_literal(expression):
+    """Find a literal string which must appear in any text matching a regex.
+
+    The expression is parsed and the longest run of plain characters in its
+    top level sequence is returned. Anything which is optional, repeated or
+    part of an alternation is skipped, so every match of the expression is
+    guaranteed to contain the literal.
+
+    Args:
+        expression (str): The regular expression.
+
+    Returns:
+        string: The casefolded literal or ``None`` if one could not be found.
+
+    """
+    if not isinstance(expression, str):
+        return None
+
+    # pylint: disable=broad-except
+    # The regex module supports syntax which the standard library parser
+    # does not understand. Those expressions simply don't get a literal.
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            parsed = sre_parse.parse(expression)
+    except Exception:
+        return None
+
+    longest = ""
+    run = []
+    for op, value in list(parsed) + [(None, None)]:
+        if op is sre_parse.LITERAL:
+            run.append(chr(value))
+            continue
+        if len(run) > len(longest):
+            longest = "".join(run)
+        run = []
+
+    return longest.casefold() or None
+
+
+class _LiteralAutomaton:
+    """An Aho-Corasick automaton over a set of literal strings.
+
+    Finds every literal contained in a text with a single pass over it.
+    """
+
+    def __init__(self, literals):
+        """Build the automaton.
+
+        Args:
+            literals (dict): Mapping of literal to a list of ids to report.
+
+        """
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [()]
+
+        for literal, ids in literals.items():
+            state = 0
+            for char in literal:
+                if char not in self.goto[state]:
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(())
+                    self.goto[state][char] = len(self.goto) - 1
+                state = self.goto[state][char]
+            self.output[state] += tuple(ids)
+
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self.goto[state].items():
+                queue.append(child)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(char, 0)
+                self.output[child] += self.output[self.fail[child]]
+
+    def search(self, text):
+        """Return the set of ids whose literal appears in the text."""
+        goto, fail, output = self.goto, self.fail, self.output
+        found = set()
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+        return found
+
+
+class RegexMatcherSet:
+    """All ``match_regex`` matchers compiled once for repeated matching.
+
+    Every expression is compiled with its flags up front. Expressions which
+    contain a required literal are only evaluated when a prefilter pass over
+    the message finds that literal, expressions without one are always
+    evaluated.
+
+    Args:
+        matchers (list): A list of ``(skill, matcher)`` tuples for regex matchers.
+
+    """
+
+    def __init__(self, matchers):
+        """Compile the matchers."""
+        self.entries = []
+        self.unfiltered = set()
+        literals = {}
+
+        for skill, matcher in matchers:
+            opts = matcher["regex"]
+            flags = 0 if opts["case_sensitive"] else regex.IGNORECASE
+            index = len(self.entries)
+            self.entries.append(
+                (
+                    skill,
+                    opts,
+                    regex.compile(opts["expression"], flags),
+                    opts["matching_condition"].lower(),
+                )
+            )
+
+            literal = required_literal(opts["expression"])
+            if literal is None:
+                self.unfiltered.add(index)
+            else:
+                literals.setdefault(literal, []).append(index)
+
+        self.automaton = _LiteralAutomaton(literals)
+        _LOGGER.debug(
+            _("Compiled %i regex matchers, %i without a literal prefilter."),
+            len(self.entries),
+            len(self.unfiltered),
+        )
+
+    def candidates(self, text):
+        """Return the indexes of the entries which could match the text."""
+        return sorted(self.unfiltered | self.automaton.search(text.casefold()))
+
+    def match(self, text, skills=None):
+        """Match a text against the compiled expressions.
+
+        Args:
+            text (str): The text to match.
+            skills (list, optional): Only evaluate matchers of these skills.
+
+        Returns:
+            list: ``(skill, opts, matched_regex)`` tuples for each match in
+                the order the matchers were registered.
+
+        """
+        allowed = None if skills is None else {id(skill) for skill in skills}
+        matches = []
+        for index in self.candidates(text):
+            skill, opts, pattern, condition = self.entries[index]
+            if allowed is not None and id(skill) not in allowed:
+                continue
+            if condition == "search":
+                matched_regex = pattern.search(text)
+            elif condition == "fullmatch":
+                matched_regex = pattern.fullmatch(text)
+            elif condition == "findall":
+                matched_regex = list(pattern.finditer(text))
+            else:
+                matched_regex = pattern.match(text)
+            if matched_regex:
+                matches.append((skill, opts, matched_regex))
+        return matches
+
+
 async def parse_regex(opsdroid, skills, message):
     """Parse a message against all regex skills."""
     matched_skills = []
-    for skill in skills:
-        for matcher in skill.matchers:
-            if "regex" in matcher:
-                opts = matcher["regex"]
-                matched_regex = await match_regex(message.text, opts)
-                if matched_regex:
-                    message.regex = matched_regex
-                    # If we have used findall then we have an iterable
-                    # if we haven't make it one so we can use the same codepath
-                    if opts["matching_condition"] != "findall":
-                        matched_regex = [matched_regex]
-                    for match in matched_regex:
-                        for regroup, value in match.groupdict().items():
-                            message.update_entity(regroup, value, None, append=True)
-                    matched_skills.append(
-                        {
-                            "score": await calculate_score(
-                                opts["expression"], opts["score_factor"]
-                            ),
-                            "skill": skill,
-                            "config": skill.config,
-                            "message": message,
-                        }
-                    )
+    if skills is opsdroid.skills:
+        skills = None
+    matcher_set = opsdroid.get_compiled_matchers("regex", RegexMatcherSet)
+    for skill, opts, matched_regex in matcher_set.match(message.text, skills):
+        message.regex = matched_regex
+        # If we have used findall then we have an iterable
+        # if we haven't make it one so we can use the same codepath
+        if opts["matching_condition"] != "findall":
+            matched_regex = [matched_regex]
+        for match in matched_regex:
+            for regroup, value in match.groupdict().items():
+                message.update_entity(regroup, value, None, append=True)
+        matched_skills.append(
+            {
+                "score": await calculate_score(
+                    opts["expression"], opts["score_factor"]
+                ),
+                "skill": skill,
+                "config": skill.config,
+                "message": message,
+            }
+        )
     return matched_skills
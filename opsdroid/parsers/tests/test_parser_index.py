@@ -0,0 +1,73 @@
+"""Test the opsdroid matcher index."""
+import pytest
+
+from opsdroid.cli.start import configure_lang
+from opsdroid.matchers import match_always, match_crontab, match_regex
+from opsdroid.parsers.index import MatcherIndex, matcher_kind
+
+pytestmark = pytest.mark.anyio
+
+configure_lang({})
+
+
+def get_mock_skill(name):
+    async def mockedskill(opsdroid, config, message):
+        pass
+
+    mockedskill.config = {"name": name}
+    return mockedskill
+
+
+def test_matcher_kind():
+    assert matcher_kind({"regex": {"expression": "hello"}}) == "regex"
+    assert matcher_kind({"crontab": "* * * * *", "timezone": None}) == "crontab"
+    assert matcher_kind({}) is None
+
+
+def test_index_groups_by_kind():
+    regex_skill = match_regex("hello")(get_mock_skill("regex"))
+    multi_skill = match_always()(match_regex("world")(get_mock_skill("multi")))
+    cron_skill = match_crontab("* * * * *")(get_mock_skill("cron"))
+    skills = [regex_skill, multi_skill, cron_skill]
+
+    index = MatcherIndex()
+    index.build(skills)
+
+    assert [skill for skill, _ in index.get("regex")] == [regex_skill, multi_skill]
+    assert [skill for skill, _ in index.get("always")] == [multi_skill]
+    assert [skill for skill, _ in index.get("crontab")] == [cron_skill]
+    assert index.get("parse_format") == []
+
+
+def test_index_restrict_to_skills():
+    first = match_regex("hello")(get_mock_skill("first"))
+    second = match_regex("world")(get_mock_skill("second"))
+
+    index = MatcherIndex()
+    index.build([first, second])
+
+    assert [skill for skill, _ in index.get("regex", [second])] == [second]
+
+
+def test_index_is_stale():
+    skills = [match_always()(get_mock_skill("always"))]
+    index = MatcherIndex()
+    assert index.is_stale(skills)
+
+    index.build(skills)
+    assert not index.is_stale(skills)
+
+    skills.append(match_always()(get_mock_skill("another")))
+    assert index.is_stale(skills)
+    assert index.is_stale([])
+
+
+async def test_get_matchers_rebuilds_stale_index(opsdroid):
+    opsdroid.skills.append(match_always()(get_mock_skill("first")))
+    assert len(opsdroid.get_matchers("always")) == 1
+
+    opsdroid.skills.append(match_always()(get_mock_skill("second")))
+    assert len(opsdroid.get_matchers("always")) == 2
+
+    opsdroid.skills = []
+    assert opsdroid.get_matchers("always") == []
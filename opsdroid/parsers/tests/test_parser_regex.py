@@ -0,0 +1,95 @@
+"""Test the opsdroid compiled regex matcher set."""
+from unittest.mock import AsyncMock
+
+import pytest
+
+from opsdroid.cli.start import configure_lang
+from opsdroid.events import Message
+from opsdroid.matchers import match_regex
+from opsdroid.parsers.regex import RegexMatcherSet, parse_regex, required_literal
+
+pytestmark = pytest.mark.anyio
+
+configure_lang({})
+
+
+def get_mock_skill():
+    async def mockedskill(opsdroid, config, message):
+        pass
+
+    mockedskill.config = {}
+    return mockedskill
+
+
+@pytest.mark.parametrize(
+    "expression,literal",
+    [
+        (r"hello", "hello"),
+        (r"Hello (?P<name>\w+) and goodbye", " and goodbye"),
+        (r"^remind me in (\d+) minutes?$", "remind me in "),
+        (r"(?i)PING", "ping"),
+        (r"hi|hello", "h"),
+        (r"cat|dog", None),
+        (r"(.*)", None),
+        (r"a*", None),
+        (r"\p{L}+ world", None),
+    ],
+)
+def test_required_literal(expression, literal):
+    assert required_literal(expression) == literal
+
+
+def test_matcher_set_prefilter():
+    hello = match_regex(r"hello (?P<name>\w+)")(get_mock_skill())
+    ping = match_regex(r"ping", case_sensitive=False)(get_mock_skill())
+    anything = match_regex(r"(.*)")(get_mock_skill())
+    matchers = [(skill, skill.matchers[0]) for skill in (hello, ping, anything)]
+
+    matcher_set = RegexMatcherSet(matchers)
+
+    assert matcher_set.candidates("hello world") == [0, 2]
+    assert matcher_set.candidates("PING") == [1, 2]
+    assert [skill for skill, _, _ in matcher_set.match("PING")] == [ping, anything]
+    assert [skill for skill, _, _ in matcher_set.match("ping", [ping])] == [ping]
+
+
+def test_matcher_set_prefilter_is_case_sensitive_when_evaluating():
+    skill = match_regex(r"hello")(get_mock_skill())
+
+    matcher_set = RegexMatcherSet([(skill, skill.matchers[0])])
+
+    assert matcher_set.candidates("HELLO") == [0]
+    assert matcher_set.match("HELLO") == []
+
+
+def test_matcher_set_overlapping_literals():
+    skills = [
+        match_regex(expression, matching_condition="search")(get_mock_skill())
+        for expression in ("she", "he", "hers", "his")
+    ]
+
+    matcher_set = RegexMatcherSet([(skill, skill.matchers[0]) for skill in skills])
+
+    assert matcher_set.candidates("ushers") == [0, 1, 2]
+
+
+async def test_parse_regex_findall_entities(opsdroid):
+    skill = match_regex(r"(?P<num>\d+)", matching_condition="findall")(get_mock_skill())
+    opsdroid.skills.append(skill)
+
+    message = Message("1 and 2", "user", "default", AsyncMock())
+    skills = await parse_regex(opsdroid, opsdroid.skills, message)
+
+    assert skills[0]["skill"] is skill
+    assert [entity["value"] for entity in message.entities["num"]] == ["1", "2"]
+
+
+async def test_parse_regex_constrained_skills(opsdroid):
+    first = match_regex(r"hello")(get_mock_skill())
+    second = match_regex(r"hello")(get_mock_skill())
+    opsdroid.skills.extend([first, second])
+
+    message = Message("hello", "user", "default", AsyncMock())
+    skills = await parse_regex(opsdroid, [second], message)
+
+    assert [match["skill"] for match in skills] == [second]
@@ -1,11 +1,14 @@
+import asyncio
 import os
 import signal
 import threading
+import time
 
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 import pytest
 
 from opsdroid.core import OpsDroid
+from opsdroid.events import Message
 
 
 @pytest.mark.skipif(os.name == "nt", reason="SIGHUP unsupported on windows")
@@ -28,3 +31,51 @@ def test_signals(event_loop):
         with pytest.raises(SystemExit):
             opsdroid.run()
         assert opsdroid.reload.called
+
+
+@pytest.mark.anyio
+async def test_nlu_parsers_run_concurrently(opsdroid):
+    async def slow_parser(opsdroid, skills, message, config):
+        await asyncio.sleep(0.2)
+        return [{"score": config["score"], "skill": config["name"]}]
+
+    opsdroid.modules = {
+        "parsers": [
+            {"config": {"name": "witai", "enabled": True, "score": 0.5}},
+            {"config": {"name": "luisai", "enabled": True, "score": 0.9}},
+        ]
+    }
+    message = Message("Hello world")
+    with patch("opsdroid.core.parse_witai", slow_parser), patch(
+        "opsdroid.core.parse_luisai", slow_parser
+    ):
+        start = time.monotonic()
+        ranked_skills = await opsdroid.get_ranked_skills([], message)
+
+    assert time.monotonic() - start < 0.35
+    assert [skill["skill"] for skill in ranked_skills] == ["luisai", "witai"]
+
+
+@pytest.mark.anyio
+async def test_nlu_parser_timeout(opsdroid, caplog):
+    async def slow_parser(opsdroid, skills, message, config):
+        await asyncio.sleep(10)
+
+    async def fast_parser(opsdroid, skills, message, config):
+        return [{"score": 0.5, "skill": config["name"]}]
+
+    opsdroid.modules = {
+        "parsers": [
+            {"config": {"name": "witai", "enabled": True, "timeout": 0.05}},
+            {"config": {"name": "luisai", "enabled": True}},
+        ]
+    }
+    message = Message("Hello world")
+    with patch("opsdroid.core.parse_witai", slow_parser), patch(
+        "opsdroid.core.parse_luisai", fast_parser
+    ):
+        ranked_skills = await opsdroid.get_ranked_skills([], message)
+
+    assert [skill["skill"] for skill in ranked_skills] == ["luisai"]
+    assert opsdroid.stats["parser_timeouts"] == 1
+    assert "Parser witai timed out" in caplog.text
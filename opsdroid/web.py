@@ -348,7 +348,9 @@ class Web:
                     "total_response_time": stats["total_response_time"],
                     "total_responses": stats["total_responses"],
                     "average_response_time": stats["average_response_time"],
+                    "parser_timeouts": stats["parser_timeouts"],
                 },
+                "parsers": stats["parsers"],
                 "modules": {
                     "skills": len(self.opsdroid.skills),
                     "connectors": len(self.opsdroid.connectors),
@@ -0,0 +1,131 @@
+"""Benchmark the compiled regex matcher set against a linear scan."""
+import argparse
+import random
+import timeit
+
+import regex
+
+from opsdroid.cli.start import configure_lang
+from opsdroid.matchers import match_regex
+from opsdroid.parsers.regex import RegexMatcherSet
+
+WORDS = [
+    "deploy",
+    "status",
+    "remind",
+    "weather",
+    "restart",
+    "ticket",
+    "build",
+    "release",
+    "oncall",
+    "translate",
+]
+
+
+def make_skill():
+    """Create an empty skill function."""
+
+    async def skill(opsdroid, config, message):
+        pass
+
+    return skill
+
+
+def make_skills(count):
+    """Create regex skills with a mix of matching conditions."""
+    skills = []
+    for i in range(count):
+        word = WORDS[i % len(WORDS)]
+        if i % 3 == 0:
+            decorator = match_regex(rf"{word}{i} (?P<target>\w+)")
+        elif i % 3 == 1:
+            decorator = match_regex(
+                rf"please {word}{i}", case_sensitive=False, matching_condition="search"
+            )
+        else:
+            decorator = match_regex(rf"^{word}{i} now$", matching_condition="fullmatch")
+        skills.append(decorator(make_skill()))
+    return skills
+
+
+def make_messages(count, skills):
+    """Create messages where roughly half hit a skill."""
+    messages = []
+    for i in range(count):
+        if i % 2:
+            messages.append(f"could you {random.choice(WORDS)} something for me")
+        else:
+            messages.append(
+                f"{random.choice(WORDS)}{random.randrange(len(skills))} now"
+            )
+    return messages
+
+
+def linear_scan(skills, text):
+    """Match a text the way parse_regex used to, one expression at a time."""
+    matches = []
+    for skill in skills:
+        for matcher in skill.matchers:
+            opts = matcher["regex"]
+            flags = False if opts["case_sensitive"] else regex.IGNORECASE
+            condition = opts["matching_condition"].lower()
+            if condition == "search":
+                matched = regex.search(opts["expression"], text, flags)
+            elif condition == "fullmatch":
+                matched = regex.fullmatch(opts["expression"], text, flags)
+            else:
+                matched = regex.match(opts["expression"], text, flags)
+            if matched:
+                matches.append(skill)
+    return matches
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    args = parser.parse_args()
+
+    configure_lang({})
+    random.seed(0)
+
+    print(
+        f"{'skills':>8} {'linear (us/msg)':>16} {'compiled (us/msg)':>18} {'speedup':>8}"
+    )
+    for size in args.sizes:
+        skills = make_skills(size)
+        messages = make_messages(args.messages, skills)
+        matcher_set = RegexMatcherSet(
+            [(skill, matcher) for skill in skills for matcher in skill.matchers]
+        )
+
+        for text in messages:
+            assert [skill for skill, _, _ in matcher_set.match(text)] == linear_scan(
+                skills, text
+            )
+
+        linear = min(
+            timeit.repeat(
+                lambda: [linear_scan(skills, text) for text in messages],
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        compiled = min(
+            timeit.repeat(
+                lambda: [matcher_set.match(text) for text in messages],
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        print(
+            f"{size:>8} {linear / len(messages) * 1e6:>16.1f} "
+            f"{compiled / len(messages) * 1e6:>18.1f} {linear / compiled:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()